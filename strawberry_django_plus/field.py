@@ -223,6 +223,16 @@ class StrawberryDjangoField(_StrawberryDjangoField):
     def model(self) -> Optional[Type[models.Model]]:
         return (type_origin := self.type_origin) and type_origin._django_type.model
 
+    @cached_property
+    def is_connection(self) -> bool:
+        # This is checked for every resolved queryset, cache it to avoid the issubclass call
+        f_type = self.type
+        return isinstance(f_type, type) and issubclass(f_type, relay.Connection)
+
+    @cached_property
+    def has_connection_extension(self) -> bool:
+        return any(isinstance(e, relay.ConnectionExtension) for e in self.extensions)
+
     @cached_property
     def safe_resolver(self):
         resolver = self.base_resolver
@@ -279,7 +289,7 @@ class StrawberryDjangoField(_StrawberryDjangoField):
         def qs_resolver(qs):
             if self.is_list:
                 retval = self.get_queryset_as_list(qs, info, kwargs)
-            elif isinstance((f_type := self.type), type) and issubclass(f_type, relay.Connection):
+            elif self.is_connection:
                 retval = self.get_queryset_as_list(qs, info, kwargs, skip_fetch=True)
             else:
                 retval = self.get_queryset_one(qs, info, kwargs)
@@ -324,13 +334,20 @@ class StrawberryDjangoField(_StrawberryDjangoField):
             nodes: Optional[List[relay.GlobalID]] = kwargs.get("ids")
             if isinstance(nodes, list):
                 if nodes:
-                    assert {n.resolve_type(info) for n in nodes} == {unwrap_type(self.type)}
+                    expected = unwrap_type(self.type)
+                    # Resolve the type only once for each distinct type name
+                    by_type_name = {n.type_name: n for n in nodes}
+                    if invalid := [
+                        type_name
+                        for type_name, n in by_type_name.items()
+                        if n.resolve_type(info) != expected
+                    ]:
+                        type_name = get_object_definition(expected, strict=True).name
+                        raise TypeError(f"Expected {type_name} ids, got {', '.join(invalid)}")
                 qs = qs.filter(pk__in=[n.node_id for n in nodes])
 
         qs = self.get_queryset(filter_with_perms(qs, info), info, **kwargs)
-        if not skip_fetch and not any(
-            isinstance(e, relay.ConnectionExtension) for e in self.extensions
-        ):
+        if not skip_fetch and not self.has_connection_extension:
             # This is what QuerySet does internally to fetch results.
             # After this, iterating over the queryset should be async safe
             qs._fetch_all()  # type: ignore
@@ -352,7 +369,12 @@ class StrawberryDjangoField(_StrawberryDjangoField):
             if not self.base_resolver:
                 node = kwargs.get("id")
                 if isinstance(node, relay.GlobalID):
-                    assert node.resolve_type(info) == unwrap_type(self.type)
+                    expected = unwrap_type(self.type)
+                    if node.resolve_type(info) != expected:
+                        type_name = get_object_definition(expected, strict=True).name
+                        raise TypeError(  # noqa: TRY301
+                            f"Expected {type_name} id, got {node.type_name}",
+                        )
                     qs = qs.filter(pk=node.node_id)
         except ObjectDoesNotExist:
             if not self.is_optional:
@@ -432,12 +454,12 @@ class StrawberryDjangoConnectionExtension(relay.ConnectionExtension):
         last: Optional[int] = None,
         **kwargs: Any,
     ) -> Any:
-        assert self.connection_type is not None
-        nodes = cast(Iterable[relay.Node], next_(source, info, **kwargs))
+        nodes: Iterable[relay.Node] = next_(source, info, **kwargs)
 
         # We have a single resolver for both sync and async, so we need to check if
-        # nodes is awaitable or not and resolve it accordingly
-        if inspect.isawaitable(nodes):
+        # nodes is awaitable or not and resolve it accordingly.
+        # Avoid isawaitable for querysets and lists, which are what we get most of the time
+        if not isinstance(nodes, (QuerySet, list)) and inspect.isawaitable(nodes):
 
             async def resolver():
                 resolved = self.connection_type.resolve_connection(
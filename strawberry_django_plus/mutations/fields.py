@@ -1,5 +1,7 @@
 import dataclasses
+import functools
 import sys
+from functools import cached_property
 from typing import (
     Any,
     Callable,
@@ -47,6 +49,18 @@ from . import resolvers
 
 _T = TypeVar("_T")
 
+try:
+    # Try to use the smaller/faster cache decorator if available
+    _cache = functools.cache  # type: ignore
+except AttributeError:  # pragma:nocover
+    _cache = functools.lru_cache
+
+
+@_cache
+def _get_payload_name(name: str) -> str:
+    name = to_camel_case(name)
+    return f"{name[0].upper()}{name[1:]}Payload"
+
 
 def _get_validation_errors(error: Exception):
     if isinstance(error, PermissionDenied):
@@ -115,8 +129,6 @@ class DjangoMutationField(StrawberryDjangoField):
 
     def __call__(self, resolver: Callable[..., Iterable[relay.Node]]):
         if self._handle_errors:
-            name = to_camel_case(resolver.__name__)
-            cap_name = name[0].upper() + name[1:]
             namespace = sys.modules[resolver.__module__].__dict__
             annotation = StrawberryAnnotation(
                 resolver.__annotations__["return"],
@@ -125,7 +137,7 @@ class DjangoMutationField(StrawberryDjangoField):
             # Transform the return value into a union of it with OperationMessages
             types_ = tuple(get_possible_types(annotation.resolve()))
             resolver.__annotations__["return"] = strawberry.union(
-                f"{cap_name}Payload",
+                _get_payload_name(resolver.__name__),
                 (*types_, OperationInfo),
             )
         return super().__call__(resolver)
@@ -137,16 +149,13 @@ class DjangoMutationField(StrawberryDjangoField):
     @type.setter
     def type(self, type_: Any) -> None:  # noqa: A003
         if type_ is not None and self._handle_errors:
-            name = to_camel_case(self.python_name)
-            cap_name = name[0].upper() + name[1:]
-
             if isinstance(type_, StrawberryAnnotation):
                 type_ = type_.annotation
 
             types_ = tuple(get_possible_types(type_))
             if OperationInfo not in types_:
                 types_ = (*types_, OperationInfo)
-            type_ = strawberry.union(f"{cap_name}Payload", types_)
+            type_ = strawberry.union(_get_payload_name(self.python_name), types_)
 
         super(DjangoMutationField, self.__class__).type.fset(self, type_)  # type: ignore
 
@@ -172,8 +181,10 @@ class DjangoCUDMutationField(DjangoMutationField):
         self.input_type = input_type
         self.full_clean = full_clean
 
-    @property
-    def arguments(self) -> List[StrawberryArgument]:
+    @cached_property
+    def arguments(self) -> List[StrawberryArgument]:  # type: ignore
+        # Strawberry reads this on every resolution, and the input argument never
+        # changes after the field is created
         namespace = sys.modules[self.input_type.__module__].__dict__
         type_def = get_object_definition(self.input_type)
         return [
@@ -1,5 +1,4 @@
-import inspect
-from typing import TYPE_CHECKING, Any, Optional, Sized, cast
+from typing import Any, Optional
 
 import django
 import strawberry
@@ -13,9 +12,6 @@ from typing_extensions import Self
 
 from .field import field
 
-if TYPE_CHECKING:
-    from django.db import models
-
 
 @strawberry.type(name="Connection", description="A connection to a list of items.")
 class ListConnectionWithTotalCount(relay.ListConnection[relay.NodeType]):
@@ -24,15 +20,27 @@ class ListConnectionWithTotalCount(relay.ListConnection[relay.NodeType]):
     @field
     def total_count(self) -> Optional[int]:
         """Total quantity of existing nodes."""
-        assert self.nodes is not None
-        total_count = None
-        try:
-            total_count = cast("models.QuerySet[models.Model]", self.nodes).count()
-        except (AttributeError, ValueError, TypeError):
-            if isinstance(self.nodes, Sized):
-                total_count = len(self.nodes)
+        nodes = self.nodes
+        assert nodes is not None
+
+        # list.count/tuple.count count occurrences of a value, not the collection size
+        if isinstance(nodes, (list, tuple)):
+            return len(nodes)
+
+        # Peek for count() instead of raising and catching AttributeError for iterables
+        # that don't define it (e.g. generators), and look for __len__ directly instead
+        # of going through the Sized ABC subclass hook
+        count = getattr(nodes, "count", None)
+        if callable(count):
+            try:
+                return count()
+            except (AttributeError, ValueError, TypeError):
+                pass
 
-        return total_count
+        if hasattr(nodes, "__len__"):
+            return len(nodes)  # type: ignore
+
+        return None
 
     @classmethod
     def resolve_connection(
@@ -69,15 +77,15 @@ class ListConnectionWithTotalCount(relay.ListConnection[relay.NodeType]):
             **kwargs,
         )
 
-        if inspect.isawaitable(conn):
-
-            async def wrapper():
-                resolved = await conn
-                resolved.nodes = nodes
-                return resolved
+        # The connection is resolved synchronously most of the time, check for that first
+        # instead of going through isawaitable
+        if isinstance(conn, cls):
+            conn.nodes = nodes
+            return conn
 
-            return wrapper()
+        async def wrapper():
+            resolved = await conn
+            resolved.nodes = nodes
+            return resolved
 
-        conn = cast(Self, conn)
-        conn.nodes = nodes
-        return conn
+        return wrapper()
@@ -30,6 +30,22 @@ _P = ParamSpec("_P")
 _R = TypeVar("_R")
 _E = TypeVar("_E")
 
+try:
+    # Try to use the smaller/faster cache decorator if available
+    _cache = functools.cache  # type: ignore
+except AttributeError:  # pragma:nocover
+    _cache = functools.lru_cache
+
+
+@_cache
+def _get_isinstance_type(type_: Any) -> Any:
+    # ensure_type is usually the same static type for a given call site,
+    # avoid introspecting it every time a value gets resolved
+    if (origin := get_origin(type_)) and origin is Union:
+        return tuple(get_args(type_))
+
+    return type_
+
 
 def is_awaitable(
     value: AwaitableOrValue[_T],
@@ -91,8 +107,7 @@ async def resolve_async(
         ret = await cast(Awaitable, ret)
 
     if ensure_type is not None:
-        if (origin := get_origin(ensure_type)) and origin is Union:
-            ensure_type = tuple(get_args(ensure_type))
+        ensure_type = _get_isinstance_type(ensure_type)
         if not isinstance(ret, ensure_type):
             raise TypeError(f"{ensure_type} expected, found {ret!r}")
 
@@ -156,8 +171,7 @@ def resolve(value, resolver, *, ensure_type=None, info=None):
 
     ret = resolver(value)
     if ensure_type is not None:
-        if (origin := get_origin(ensure_type)) and origin is Union:
-            ensure_type = tuple(get_args(ensure_type))
+        ensure_type = _get_isinstance_type(ensure_type)
         if not isinstance(ret, ensure_type):
             raise TypeError(f"{ensure_type} expected, found {ret!r}")
 
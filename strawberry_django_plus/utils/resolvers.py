@@ -31,6 +31,12 @@ from typing_extensions import ParamSpec
 from .aio import is_awaitable, resolve_async
 from .inspect import get_django_type
 
+try:
+    # Try to use the smaller/faster cache decorator if available
+    _cache = functools.cache  # type: ignore
+except AttributeError:  # pragma:nocover
+    _cache = functools.lru_cache
+
 _T = TypeVar("_T")
 _M = TypeVar("_M", bound=Model)
 _R = TypeVar("_R")
@@ -538,6 +544,7 @@ def resolve_model_node(source, node_id, *, info: Optional[Info] = None, required
     )
 
 
+@_cache
 def resolve_model_id_attr(source: Type) -> str:
     """Resolve the model id, ensuring it is retrieved in a sync context.
 
@@ -549,6 +556,9 @@ def resolve_model_id_attr(source: Type) -> str:
         The resolved id attr
 
     """
+    # NOTE: This is cached because strawberry only caches the id attr when it finds
+    # a NodeID annotation. For types falling back to "pk", it would walk all the
+    # annotations and raise NodeIDAnnotationError on every call
     try:
         id_attr = super(source, source).resolve_id_attr()
     except NodeIDAnnotationError:
@@ -557,6 +567,17 @@ def resolve_model_id_attr(source: Type) -> str:
     return id_attr
 
 
+@_cache
+def _get_model_id_attname(source: Type, model: Type[Model]) -> str:
+    # This is called for every resolved node, so cache the attname instead of
+    # resolving the id attr and the model's pk every time
+    id_attr = cast(relay.Node, source).resolve_id_attr()
+    if id_attr == "pk":
+        id_attr = model._meta.pk.attname  # type: ignore
+
+    return id_attr
+
+
 def resolve_model_id(
     source: Union[Type[relay.Node], Type[_M]],
     root: Model,
@@ -577,14 +598,7 @@ def resolve_model_id(
         The resolved object id
 
     """
-    id_attr = cast(relay.Node, source).resolve_id_attr()
-
-    assert isinstance(root, Model)
-    if id_attr == "pk":
-        pk = root.__class__._meta.pk
-        assert pk
-        id_attr = pk.attname
-    assert id_attr
+    id_attr = _get_model_id_attname(source, root.__class__)
     try:
         # Prefer to retrieve this from the cache
         return str(root.__dict__[id_attr])
@@ -1,12 +1,35 @@
+from typing import List, Optional
+
 import pytest
+import strawberry
+from strawberry import relay
 from strawberry.relay import to_base64
+from strawberry_django.arguments import argument
 
-from demo.models import Favorite
+from demo.models import Favorite, Milestone
+from demo.schema import IssueType, MilestoneType, ProjectType
+from strawberry_django_plus import gql
+from strawberry_django_plus.relay import ListConnectionWithTotalCount
 
 from .faker import FavoriteFactory, IssueFactory, MilestoneFactory, ProjectFactory, UserFactory
 from .utils import GraphQLTestClient
 
 
+def make_ids_schema():
+    """Schema with fields filtering by the `id`/`ids` arguments without a resolver."""
+    milestone_field = gql.django.field()
+    milestone_field.arguments = [argument("id", relay.GlobalID)]
+    milestones_field = gql.django.field()
+    milestones_field.arguments = [argument("ids", List[relay.GlobalID])]
+
+    @strawberry.type
+    class Query:
+        milestone: Optional[MilestoneType] = milestone_field
+        milestones: List[MilestoneType] = milestones_field
+
+    return strawberry.Schema(Query, types=[IssueType, ProjectType])
+
+
 @pytest.mark.django_db(transaction=True)
 def test_node_single_optional(db, gql_client: GraphQLTestClient):
     query = """
@@ -677,3 +700,105 @@ def test_connection_get_queryset(db, gql_client: GraphQLTestClient):
         ]
 
     assert Favorite.objects.all().count() == 3
+
+
+@pytest.mark.django_db(transaction=True)
+def test_field_id_wrong_type(db):
+    schema = make_ids_schema()
+    query = """
+      query TestQuery ($id: GlobalID!, $pk: ID!) {
+        milestone(id: $id, pk: $pk) {
+          name
+        }
+      }
+    """
+
+    milestone = MilestoneFactory.create()
+    res = schema.execute_sync(
+        query,
+        {"id": to_base64("MilestoneType", milestone.pk), "pk": milestone.pk},
+    )
+    assert res.errors is None
+    assert res.data == {"milestone": {"name": milestone.name}}
+
+    res = schema.execute_sync(
+        query,
+        {"id": to_base64("IssueType", milestone.pk), "pk": milestone.pk},
+    )
+    assert res.data == {"milestone": None}
+    assert res.errors is not None
+    assert [e.message for e in res.errors] == ["Expected MilestoneType id, got IssueType"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_field_ids_wrong_type(db, monkeypatch):
+    schema = make_ids_schema()
+    query = """
+      query TestQuery ($ids: [GlobalID!]!) {
+        milestones(ids: $ids) {
+          name
+        }
+      }
+    """
+
+    resolved = []
+    resolve_type = relay.GlobalID.resolve_type
+
+    def _resolve_type(self, info):
+        resolved.append(self.type_name)
+        return resolve_type(self, info)
+
+    monkeypatch.setattr(relay.GlobalID, "resolve_type", _resolve_type)
+
+    milestones = MilestoneFactory.create_batch(3)
+    res = schema.execute_sync(
+        query,
+        {"ids": [to_base64("MilestoneType", m.pk) for m in milestones]},
+    )
+    assert res.errors is None
+    assert res.data == {"milestones": [{"name": m.name} for m in milestones]}
+    # The type should be resolved only once for each distinct type name
+    assert resolved == ["MilestoneType"]
+
+    resolved.clear()
+    res = schema.execute_sync(
+        query,
+        {
+            "ids": [
+                to_base64("MilestoneType", milestones[0].pk),
+                to_base64("IssueType", milestones[0].pk),
+                to_base64("MilestoneType", milestones[1].pk),
+                to_base64("ProjectType", milestones[1].pk),
+                to_base64("IssueType", milestones[2].pk),
+            ],
+        },
+    )
+    assert res.data is None
+    assert res.errors is not None
+    assert [e.message for e in res.errors] == [
+        "Expected MilestoneType ids, got IssueType, ProjectType",
+    ]
+    assert resolved == ["MilestoneType", "IssueType", "ProjectType"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_connection_total_count(db):
+    def make_connection(nodes):
+        conn = ListConnectionWithTotalCount(
+            edges=[],
+            page_info=relay.PageInfo(
+                has_next_page=False,
+                has_previous_page=False,
+                start_cursor=None,
+                end_cursor=None,
+            ),
+        )
+        conn.nodes = nodes
+        return conn
+
+    MilestoneFactory.create_batch(3)
+
+    assert make_connection(Milestone.objects.all()).total_count() == 3
+    assert make_connection([1, 2, 2]).total_count() == 3
+    assert make_connection((1, 2)).total_count() == 2
+    assert make_connection(i for i in range(3)).total_count() is None